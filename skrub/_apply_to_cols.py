@@ -67,12 +67,20 @@ class ApplyToCols(TransformerMixin, SkrubBaseEstimator):
         output column names. The default value does not modify the names.
         Renaming is not applied to columns not selected by ``cols``.
 
-    n_jobs : int, default=None
+    n_jobs : int or None, default=None
         Number of jobs to run in parallel.
         ``None`` means 1 unless in a joblib ``parallel_backend`` context.
         ``-1`` means using all processors.
-        Note that this parameter is only used when the transformer
-        is a :class:`~core.SingleColumnTransformer`.
+        When the transformer is a :class:`~core.SingleColumnTransformer`,
+        this is the number of columns processed in parallel. Otherwise, it is
+        forwarded to the ``n_jobs`` parameter of the transformer if it has
+        one, and overrides the value set on the transformer itself; ``None``
+        leaves the transformer's own ``n_jobs`` unchanged.
+
+        .. versionchanged:: 0.11.0
+           ``n_jobs`` used to be ignored for transformers that are not a
+           :class:`~core.SingleColumnTransformer`. It is now forwarded to
+           their ``n_jobs`` parameter.
 
     Attributes
     ----------
@@ -1,5 +1,6 @@
 import itertools
 
+import numpy as np
 from joblib import Parallel, delayed
 from sklearn.base import TransformerMixin, clone
 from sklearn.utils.validation import check_is_fitted
@@ -314,6 +315,11 @@ class ApplyToEachCol(TransformerMixin, SkrubBaseEstimator):
         self._columns = selectors.make_selector(self.cols).expand(X)
         results = []
         all_columns = sbd.column_names(X)
+        # Configure the output container once, on a template that is then
+        # cloned for each column: scikit-learn's clone copies the set_output
+        # configuration, so it does not need to be redone for every column.
+        transformer = clone(self.transformer)
+        _utils.set_output(transformer, X)
         parallel = Parallel(n_jobs=self.n_jobs)
         func = delayed(_fit_transform_column)
         results = parallel(
@@ -321,7 +327,7 @@ class ApplyToEachCol(TransformerMixin, SkrubBaseEstimator):
                 sbd.col(X, col_name),
                 y,
                 self._columns,
-                self.transformer,
+                transformer,
                 self.allow_reject,
                 kwargs,
             )
@@ -418,7 +424,7 @@ class ApplyToEachCol(TransformerMixin, SkrubBaseEstimator):
             Transformed feature names.
         """
         check_is_fitted(self, "all_outputs_")
-        return self.all_outputs_
+        return np.asarray(self.all_outputs_, dtype=object)
 
 
 def _prepare_transformer_input(transformer, column):
@@ -434,7 +440,10 @@ def _fit_transform_column(
     if col_name not in columns_to_handle:
         return col_name, [column], None
     transformer = clone(transformer)
-    _utils.set_output(transformer, column)
+    if not hasattr(transformer, "_sklearn_output_config"):
+        # The output configuration could not be copied from the template by
+        # clone (e.g. a Pipeline, or a custom set_output): set it explicitly.
+        _utils.set_output(transformer, column)
     transformer_input = _prepare_transformer_input(transformer, column)
     allowed = (RejectColumn,) if allow_reject else ()
     try:
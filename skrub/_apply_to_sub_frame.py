@@ -1,9 +1,15 @@
+import numpy as np
+import pandas as pd
 from sklearn.base import TransformerMixin, clone
-from sklearn.utils.validation import check_is_fitted
+from sklearn.exceptions import NotFittedError
+from sklearn.utils.fixes import parse_version
+from sklearn.utils.validation import check_is_fitted, check_memory
 
 from . import _dataframe as sbd
 from . import _utils, selectors
 from ._base import SkrubBaseEstimator
+from ._dataframe._common import pandas_version
+from ._dispatch import dispatch
 from ._join_utils import pick_column_names
 
 __all__ = ["ApplyToSubFrame"]
@@ -12,6 +18,44 @@ __all__ = ["ApplyToSubFrame"]
 _SELECT_ALL_COLUMNS = selectors.all()
 
 
+def _fit_transform_one(transformer, X, y, **kwargs):
+    """Fit a (clone of the) transformer and return it with its output.
+
+    Defined at the module level so that it can be memoized with
+    ``joblib.Memory``.
+    """
+    _utils.set_output(transformer, X)
+    transformed = transformer.fit_transform(X, y, **kwargs)
+    transformed = _utils.check_output(
+        transformer, X, transformed, allow_column_list=False
+    )
+    return transformer, transformed
+
+
+def _transform_one(transformer, X, **kwargs):
+    return transformer.transform(X, **kwargs)
+
+
+@dispatch
+def _concat_outputs(passthrough, transformed):
+    """Concatenate the passthrough and transformed columns horizontally.
+
+    Both have one row per row of the input, and the transformed column names
+    were chosen to not clash with the passthrough ones.
+    """
+    return sbd.concat(passthrough, transformed, axis=1)
+
+
+@_concat_outputs.specialize("pandas", argument_type="DataFrame")
+def _concat_outputs_pandas(passthrough, transformed):
+    # Unlike sbd.concat, which resets the index of every input (copying the
+    # data before pandas 3.0), give the transformed columns the index of the
+    # passthrough columns (selected from the input) without copying.
+    kwargs = {"copy": False} if pandas_version < parse_version("3.0") else {}
+    transformed = transformed.set_axis(passthrough.index, axis=0, **kwargs)
+    return pd.concat([passthrough, transformed], axis=1, **kwargs)
+
+
 class ApplyToSubFrame(TransformerMixin, SkrubBaseEstimator):
     """Apply a transformer to part of a dataframe.
 
@@ -54,6 +98,38 @@ class ApplyToSubFrame(TransformerMixin, SkrubBaseEstimator):
         output column names. The default value does not modify the names.
         Renaming is not applied to columns not selected by ``cols``.
 
+    memory : str, joblib.Memory or None, default=None
+        Used to cache the fitted transformer and its output. If a string is
+        given, it is the path to the caching directory. By default no caching
+        is performed. When fitting repeatedly on the same data with the same
+        transformer parameters (for example in a hyperparameter search), the
+        fitted transformer and its output are loaded from the cache instead of
+        being recomputed. The results of ``transform`` are cached as well.
+
+    internal_backend : None or 'polars', default=None
+        If ``'polars'`` and the input is a pandas DataFrame, the selected
+        columns are converted to a polars DataFrame before being passed to the
+        transformer, and the transformer's output is converted back to pandas
+        (with the index of the input). Columns not selected by ``cols`` are
+        not converted and remain unmodified. This can be faster for
+        transformers that handle polars DataFrames efficiently, such as the
+        ``TableVectorizer``. Requires polars (and pyarrow for the conversion
+        back to pandas). Polars inputs are left unchanged. The default is to
+        process the input with its own dataframe library.
+
+        Note that this is not only a performance option: the transformer sees
+        polars data and its output follows polars semantics, so output column
+        names and encodings can differ from those obtained with the default.
+        For example, the category created by the ``TableVectorizer`` for the
+        missing values of a string column is named ``<column>_nan`` with
+        pandas and ``<column>_None`` with polars.
+
+    n_jobs : int or None, default=None
+        Number of jobs to run in parallel, forwarded to the ``n_jobs``
+        parameter of ``transformer`` if it has one (for example an ensemble
+        or a ``TableVectorizer``). ``None`` means the transformer's own
+        ``n_jobs`` setting is left unchanged.
+
     Attributes
     ----------
     all_inputs_ : list of str
@@ -137,11 +213,17 @@ class ApplyToSubFrame(TransformerMixin, SkrubBaseEstimator):
         cols=_SELECT_ALL_COLUMNS,
         keep_original=False,
         rename_columns="{}",
+        memory=None,
+        internal_backend=None,
+        n_jobs=None,
     ):
         self.transformer = transformer
         self.cols = cols
         self.keep_original = keep_original
         self.rename_columns = rename_columns
+        self.memory = memory
+        self.internal_backend = internal_backend
+        self.n_jobs = n_jobs
 
     def fit(self, X, y=None, **kwargs):
         """Fit the transformer on all columns jointly.
@@ -188,42 +270,56 @@ class ApplyToSubFrame(TransformerMixin, SkrubBaseEstimator):
         """
         self.all_inputs_ = sbd.column_names(X)
         self._columns = selectors.make_selector(self.cols).expand(X)
-        to_transform = selectors.select(X, self._columns)
+        # set of the selected columns, for fast membership tests
+        self._columns_set = frozenset(self._columns)
+        to_transform = self._to_internal_backend(selectors.select(X, self._columns))
+        # The passthrough column names are derived from self.all_inputs_
+        # rather than by querying the passthrough dataframe again.
         if self.keep_original:
-            passthrough = X
+            passthrough, passthrough_names = X, self.all_inputs_
+        elif self._columns and len(self._columns_set) == len(self.all_inputs_):
+            # All columns are transformed (e.g. with the default cols): there
+            # is nothing to pass through and concatenate to the output.
+            passthrough, passthrough_names = None, []
         else:
-            passthrough = selectors.select(X, selectors.inv(self._columns))
-        passthrough_names = sbd.column_names(passthrough)
+            passthrough_names = self._unselected(self.all_inputs_)
+            passthrough = selectors.select(X, passthrough_names)
         if self._columns:
-            self.transformer_ = clone(self.transformer)
-            _utils.set_output(self.transformer_, X)
-            transformed = self.transformer_.fit_transform(to_transform, y, **kwargs)
-            transformed = _utils.check_output(
-                self.transformer_, to_transform, transformed, allow_column_list=False
+            fit_transform_one = _fit_transform_one
+            if self.memory is not None:
+                fit_transform_one = check_memory(self.memory).cache(fit_transform_one)
+            self.transformer_, transformed = fit_transform_one(
+                self._make_transformer(), to_transform, y, **kwargs
             )
+            transformed = self._from_internal_backend(X, transformed)
             suggested_names = sbd.column_names(transformed)
-            suggested_names = list(
-                map(_utils.renaming_func(self.rename_columns), suggested_names)
-            )
+            if self.rename_columns != "{}":
+                rename = _utils.renaming_func(self.rename_columns)
+                suggested_names = [rename(name) for name in suggested_names]
             self._transformed_output_names = pick_column_names(
                 suggested_names, forbidden_names=passthrough_names
             )
             transformed = sbd.set_column_names(
                 transformed, self._transformed_output_names
             )
-            result = sbd.concat(passthrough, transformed, axis=1)
+            if passthrough is None:
+                result = sbd.copy_index(X, transformed)
+            else:
+                result = _concat_outputs(passthrough, transformed)
         else:
             self.transformer_ = None
             result = passthrough
             self._transformed_output_names = []
-        self.used_inputs_ = self._columns
+        self._passthrough_names = passthrough_names
         self.created_outputs_ = self._transformed_output_names
         self.all_outputs_ = passthrough_names + self._transformed_output_names
-        # for sklearn
-        self.feature_names_in_ = self.all_inputs_
+        self._set_feature_names_out()
+        # for sklearn (feature_names_in_ is a property aliasing all_inputs_)
         self.n_features_in_ = len(self.all_inputs_)
 
-        result = sbd.copy_index(X, result)
+        # When there are passthrough columns, they are selected from X and
+        # _concat_outputs gives its result their index, so the output already
+        # has the index of X and we do not need an extra sbd.copy_index.
         return result
 
     def transform(self, X, **kwargs):
@@ -243,26 +339,115 @@ class ApplyToSubFrame(TransformerMixin, SkrubBaseEstimator):
         result : Pandas or Polars DataFrame
             The transformed data.
         """
-        check_is_fitted(self, "transformer_")
+        # An explicit check is much cheaper than sklearn's check_is_fitted,
+        # which matters as transform is called for every prediction.
+        if not hasattr(self, "transformer_"):
+            raise NotFittedError(
+                f"This {self.__class__.__name__} instance is not fitted yet. Call"
+                " 'fit' with appropriate arguments before using this estimator."
+            )
 
         # do the selection even if self._columns is empty to raise if X doesn't
         # have the right columns
-        to_transform = selectors.select(X, self._columns)
+        to_transform = self._to_internal_backend(selectors.select(X, self._columns))
+        X_names = sbd.column_names(X)
         if self.keep_original:
             passthrough = X
+        elif X_names == self.all_inputs_:
+            # X has the same columns as during fit: reuse the passthrough
+            # columns recorded by fit_transform rather than resolving the
+            # inverted selector again, which is costly for wide dataframes.
+            if self._columns and not self._passthrough_names:
+                passthrough = None
+            else:
+                passthrough = selectors.select(X, self._passthrough_names)
         else:
-            passthrough = selectors.select(X, selectors.inv(self._columns))
+            passthrough = selectors.select(X, self._unselected(X_names))
         if not self._columns:
             return passthrough
-        transformed = self.transformer_.transform(to_transform, **kwargs)
+        if self.memory is None:
+            transformed = self.transformer_.transform(to_transform, **kwargs)
+        else:
+            transform_one = check_memory(self.memory).cache(_transform_one)
+            transformed = transform_one(self.transformer_, to_transform, **kwargs)
+        transformed = self._from_internal_backend(X, transformed)
         # we do not call `_utils.check_output` here, assuming that if the output
         # had a correct type (e.g. polars dataframe) in `fit_transform` it will
         # have the same (correct) type in `transform`.
         transformed = sbd.set_column_names(transformed, self._transformed_output_names)
-        result = sbd.concat(passthrough, transformed, axis=1)
-        result = sbd.copy_index(X, result)
+        if passthrough is None:
+            result = sbd.copy_index(X, transformed)
+        else:
+            result = _concat_outputs(passthrough, transformed)
         return result
 
+    # Fitted attributes that alias other attributes are exposed as properties
+    # rather than stored twice. They raise AttributeError before fit, as
+    # expected by hasattr checks.
+
+    @property
+    def used_inputs_(self):
+        return self._columns
+
+    @property
+    def feature_names_in_(self):
+        return self.all_inputs_
+
+    # Attributes that can be recomputed from other fitted attributes are not
+    # pickled, to make persisted learners smaller and faster to load.
+
+    def __getstate__(self):
+        state = dict(super().__getstate__())
+        state.pop("_columns_set", None)
+        state.pop("_feature_names_out", None)
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        if "_columns" in state:
+            self._columns_set = frozenset(self._columns)
+        if "all_outputs_" in state:
+            self._set_feature_names_out()
+
+    def _set_feature_names_out(self):
+        # Stored as an array once so get_feature_names_out does not convert it
+        # at each call. It is read-only because get_feature_names_out returns
+        # it without a copy, and callers must not be able to modify it.
+        self._feature_names_out = np.asarray(self.all_outputs_, dtype=object)
+        self._feature_names_out.setflags(write=False)
+
+    def _make_transformer(self):
+        transformer = clone(self.transformer)
+        if self.n_jobs is not None and "n_jobs" in transformer.get_params(deep=False):
+            transformer.set_params(n_jobs=self.n_jobs)
+        return transformer
+
+    def _unselected(self, column_names):
+        # Same as expanding selectors.inv(self._columns), but a set lookup is
+        # much cheaper than matching each column against the selector.
+        return [c for c in column_names if c not in self._columns_set]
+
+    # Only the selected columns go through the internal backend: passthrough
+    # columns are never converted so they remain unmodified in the output.
+
+    def _to_internal_backend(self, to_transform):
+        if self.internal_backend not in (None, "polars"):
+            raise ValueError(
+                "'internal_backend' should be None or 'polars', got"
+                f" {self.internal_backend!r}."
+            )
+        if self.internal_backend is None or not sbd.is_pandas(to_transform):
+            return to_transform
+        pl = _utils.import_optional_dependency(
+            "polars", extra="It is required when internal_backend='polars'."
+        )
+        return pl.from_pandas(to_transform)
+
+    def _from_internal_backend(self, X, transformed):
+        if sbd.is_pandas(X) and not sbd.is_pandas(transformed):
+            return sbd.copy_index(X, sbd.to_pandas(transformed))
+        return transformed
+
     # set_output api compatibility
 
     def get_feature_names_out(self, input_features=None):
@@ -274,4 +459,4 @@ class ApplyToSubFrame(TransformerMixin, SkrubBaseEstimator):
             Transformed feature names.
         """
         check_is_fitted(self, "all_outputs_")
-        return self.all_outputs_
+        return self._feature_names_out
@@ -592,12 +592,19 @@ def set_column_names(df, new_col_names):
 
 @set_column_names.specialize("pandas", argument_type="DataFrame")
 def _set_column_names_pandas(df, new_col_names):
-    return df.set_axis(new_col_names, axis=1)
+    # Before pandas 3.0 (without copy-on-write), set_axis copies the data
+    # unless we pass copy=False.
+    kwargs = {"copy": False} if pandas_version < parse_version("3.0") else {}
+    return df.set_axis(new_col_names, axis=1, **kwargs)
 
 
 @set_column_names.specialize("polars", argument_type="DataFrame")
 def _set_column_names_polars(df, new_col_names):
-    return df.rename(dict(zip(df.columns, new_col_names)))
+    # Assigning the names on a (cheap, zero-copy) clone avoids building a
+    # mapping for rename, and the input is not modified.
+    df = df.clone()
+    df.columns = new_col_names
+    return df
 
 
 @dispatch
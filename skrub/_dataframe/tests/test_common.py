@@ -218,6 +218,14 @@ def test_concat_horizontal(df_module, example_data_dict):
         # Index of the first dataframe is kept
         assert_array_equal(df.index, [10, 20])
 
+        # Dataframes of different lengths are aligned by position and the
+        # shorter one is padded with nulls
+        df1 = df_module.DataFrame({"a": [1, 2, 3]}, index=[10, 20, 30])
+        df2 = df_module.DataFrame({"b": [4.0, 5.0]})
+        df = ns.concat(df1, df2, axis=1)
+        assert_array_equal(df.index, [10, 20, 30])
+        assert ns.to_list(ns.is_null(ns.col(df, "b"))) == [False, False, True]
+
 
 def test_concat_vertical(df_module, example_data_dict):
     df1 = df_module.make_dataframe(example_data_dict)
@@ -156,18 +156,28 @@ def pick_column_names(suggested_names, forbidden_names=()):
     return all_new_names
 
 
+_SKRUB_TAG_PATTERN = re.compile("__skrub_.*?__")
+
+
 def _get_new_name(suggested_name, forbidden_names):
-    tag_pattern = "__skrub_.*?__"
-    tags = re.findall(tag_pattern, suggested_name)
-    untagged_name = re.sub(tag_pattern, "", suggested_name)
+    # Most names do not contain a tag; avoid running the regex on them.
+    if "__skrub_" in suggested_name:
+        tags = _SKRUB_TAG_PATTERN.findall(suggested_name)
+        untagged_name = _SKRUB_TAG_PATTERN.sub("", suggested_name)
+    else:
+        tags, untagged_name = [], suggested_name
     if len(tags) == 1:
         suggested_name = untagged_name + tags[0]
     else:
         suggested_name = untagged_name
     if suggested_name not in forbidden_names:
         return suggested_name
-    token = _utils.random_string()
-    return f"{untagged_name}__skrub_{token}__"
+    # Tag collisions are extremely unlikely, but check so that the result is
+    # guaranteed not to be a forbidden name.
+    while True:
+        new_name = f"{untagged_name}__skrub_{_utils.random_string()}__"
+        if new_name not in forbidden_names:
+            return new_name
 
 
 def make_column_names_unique(*dataframes):
@@ -124,7 +124,7 @@ def clone_if_default(estimator, default_estimator):
 
 
 def random_string():
-    return secrets.token_hex()[:8]
+    return secrets.token_hex(4)
 
 
 def get_duplicates(values):
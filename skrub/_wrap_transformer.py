@@ -54,9 +54,11 @@ def wrap_transformer(
         Format string applied to output column names. See the documentation of
         ``ApplyToEachCol`` or ``ApplyToSubFrame`` for details.
 
-    n_jobs : int, default=None
-        Number of jobs to run in parallel. Only used when the result is an
-        instance of ``ApplyToEachCol``, see this class' docstring for details.
+    n_jobs : int or None, default=None
+        Number of jobs to run in parallel. For ``ApplyToEachCol`` it controls
+        the parallel processing of columns; for ``ApplyToSubFrame`` it is
+        forwarded to the ``n_jobs`` parameter of ``transformer``, if it has
+        one. See the docstrings of these classes for details.
 
     columnwise : 'auto' or bool, default='auto'
         Whether to create a ``ApplyToEachCol`` or ``ApplyToSubFrame`` instance. By
@@ -111,4 +113,5 @@ def wrap_transformer(
         cols=cols,
         keep_original=keep_original,
         rename_columns=rename_columns,
+        n_jobs=n_jobs,
     )
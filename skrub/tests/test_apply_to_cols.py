@@ -6,7 +6,7 @@ import pytest
 from sklearn.exceptions import NotFittedError
 from sklearn.preprocessing import OrdinalEncoder, StandardScaler
 
-from skrub import ApplyToCols
+from skrub import ApplyToCols, TableVectorizer
 from skrub import _dataframe as sbd
 from skrub import selectors as s
 from skrub._to_datetime import ToDatetime
@@ -30,6 +30,15 @@ def test_non_single_column_transformer_becomes_apply_to_subframe(df_module):
     assert hasattr(at, "transformer_")
 
 
+def test_n_jobs_forwarded_to_non_single_column_transformer(df_module):
+    X = df_module.make_dataframe({"col1": [1.0, 2.0], "col2": [3.0, 4.0]})
+    at = ApplyToCols(TableVectorizer(n_jobs=1), n_jobs=2).fit(X)
+    assert at.transformer_.n_jobs == 2
+    assert at.transformer.n_jobs == 1
+    at = ApplyToCols(TableVectorizer(n_jobs=1)).fit(X)
+    assert at.transformer_.n_jobs == 1
+
+
 def test_invalid_parameters():
     """all these parameters should be boolean."""
 
@@ -208,7 +217,14 @@ def test_get_feature_names_out_after_fit(df_module):
     at.fit(X)
 
     feature_names = at.get_feature_names_out()
-    assert feature_names == ["date_col"]
+    assert isinstance(feature_names, np.ndarray)
+    assert feature_names.tolist() == ["date_col"]
+
+    # non-single-column transformers also give an array
+    at = ApplyToCols(OrdinalEncoder()).fit(X)
+    feature_names = at.get_feature_names_out()
+    assert isinstance(feature_names, np.ndarray)
+    assert feature_names.tolist() == ["date_col"]
 
 
 def test_getattr_raises_for_wrong_attribute(df_module):
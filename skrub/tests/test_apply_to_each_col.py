@@ -92,7 +92,7 @@ def test_apply_to_each_col(
         expected_data.pop("a 1 * 2.0")
     expected = df_module.make_dataframe(expected_data)
     df_module.assert_frame_equal(out, expected)
-    assert mapper.get_feature_names_out() == list(expected_data.keys())
+    assert mapper.get_feature_names_out().tolist() == list(expected_data.keys())
 
 
 def test_empty_selection(df_module):
@@ -1,3 +1,4 @@
+import pickle
 import re
 
 import numpy as np
@@ -6,12 +7,14 @@ import pytest
 from packaging.version import parse
 from pandas.testing import assert_index_equal
 from sklearn.base import BaseEstimator
+from sklearn.exceptions import NotFittedError
 from sklearn.preprocessing import FunctionTransformer
 
-from skrub import SelectCols
+from skrub import SelectCols, TableVectorizer
 from skrub import _dataframe as sbd
 from skrub import selectors as s
 from skrub._apply_to_sub_frame import ApplyToSubFrame
+from skrub.conftest import skip_polars_installed_without_pyarrow
 
 
 class Dummy(BaseEstimator):
@@ -49,7 +52,10 @@ def test_on_subframe(df_module, use_fit_transform):
     }
     expected = df_module.make_dataframe(expected_data)
     df_module.assert_frame_equal(out, expected)
-    assert transformer.get_feature_names_out() == list(expected_data.keys())
+    assert transformer.get_feature_names_out().tolist() == list(expected_data.keys())
+    feature_names = transformer.get_feature_names_out()
+    with pytest.raises(ValueError, match=".*read-only"):
+        feature_names[0] = "zzz"
 
 
 def test_empty_selection(df_module, use_fit_transform):
@@ -130,3 +136,159 @@ def test_output_index(cols):
     assert_index_equal(transformer.fit_transform(df).index, df.index)
     df = pd.DataFrame({"a": [10, 20], "b": [1.1, 2.2]}, index=[-10, 20])
     assert_index_equal(transformer.transform(df).index, df.index)
+
+
+class CountsFits(BaseEstimator):
+    n_fits = 0
+    n_transforms = 0
+
+    def fit_transform(self, X, y=None):
+        CountsFits.n_fits += 1
+        return X
+
+    def transform(self, X):
+        CountsFits.n_transforms += 1
+        return X
+
+
+def test_memory(df_module, tmp_path):
+    CountsFits.n_fits = 0
+    CountsFits.n_transforms = 0
+    df = df_module.make_dataframe({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+    transformer = ApplyToSubFrame(CountsFits(), cols=["a"], memory=str(tmp_path))
+    out_1 = transformer.fit_transform(df)
+    out_2 = transformer.fit_transform(df)
+    assert CountsFits.n_fits == 1
+    df_module.assert_frame_equal(out_1, out_2)
+    df_module.assert_frame_equal(transformer.transform(df), out_1)
+    assert CountsFits.n_transforms == 1
+    df_module.assert_frame_equal(transformer.transform(df), out_1)
+    assert CountsFits.n_transforms == 1
+    transformer.fit_transform(df_module.make_dataframe({"a": [5.0], "b": [6.0]}))
+    assert CountsFits.n_fits == 2
+    # without memory, nothing is cached
+    transformer = ApplyToSubFrame(CountsFits(), cols=["a"]).fit(df)
+    transformer.transform(df)
+    transformer.transform(df)
+    assert CountsFits.n_fits == 3
+    assert CountsFits.n_transforms == 3
+
+
+def test_transform_reordered_columns(df_module):
+    df = df_module.make_dataframe({"a": [1.0, 2.0], "b": [3.0, 4.0], "c": [5.0, 6.0]})
+    transformer = ApplyToSubFrame(FunctionTransformer(), cols=["b"])
+    expected = transformer.fit_transform(df)
+    reordered = s.select(df, ["c", "b", "a"])
+    out = transformer.transform(reordered)
+    df_module.assert_frame_equal(out, s.select(expected, ["c", "a", "b"]))
+
+
+@pytest.mark.parametrize("keep_original", [False, True])
+def test_all_columns_transformed(df_module, use_fit_transform, keep_original):
+    df = df_module.make_dataframe({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+    transformer = ApplyToSubFrame(
+        FunctionTransformer(), keep_original=keep_original, rename_columns="{}_t"
+    )
+    if use_fit_transform:
+        out = transformer.fit_transform(df)
+    else:
+        out = transformer.fit(df).transform(df)
+    expected_names = ["a_t", "b_t"]
+    if keep_original:
+        expected_names = ["a", "b"] + expected_names
+    assert sbd.column_names(out) == expected_names
+    assert transformer.all_outputs_ == expected_names
+
+
+@skip_polars_installed_without_pyarrow
+def test_internal_backend_polars(use_fit_transform):
+    pytest.importorskip("polars")
+    df = pd.DataFrame(
+        {
+            "a": [1.0, 2.0],
+            "b": [3.0, 4.0],
+            "int": pd.array([1, None], dtype="Int64"),
+            "cat": pd.Series(["x", "y"], dtype="category"),
+            "dt": pd.to_datetime(["2020-01-01", "2020-01-02"]).tz_localize(
+                "Europe/Paris"
+            ),
+        },
+        index=[10, 20],
+    )
+    transformer = ApplyToSubFrame(Dummy(), cols=["a"], internal_backend="polars")
+    y = [0.0, 1.0]
+    if use_fit_transform:
+        out = transformer.fit_transform(df, y)
+    else:
+        out = transformer.fit(df, y).transform(df)
+    expected = ApplyToSubFrame(Dummy(), cols=["a"]).fit_transform(df, y)
+    pd.testing.assert_frame_equal(out, expected)
+    # passthrough columns are not converted to polars and back
+    for col in ["b", "int", "cat", "dt"]:
+        assert out[col].dtype == df[col].dtype
+        pd.testing.assert_series_equal(out[col], df[col])
+
+
+@skip_polars_installed_without_pyarrow
+def test_internal_backend_polars_semantics():
+    # The transformer sees polars data, so its output follows polars
+    # semantics. Here, the null category of a string column is named
+    # differently.
+    pytest.importorskip("polars")
+    df = pd.DataFrame({"s": ["a", None, "b", "a"], "x": [1.0, 2.0, 3.0, 4.0]})
+    out = ApplyToSubFrame(TableVectorizer(), cols=["s"]).fit_transform(df)
+    assert list(out.columns) == ["x", "s_a", "s_b", "s_nan"]
+    out = ApplyToSubFrame(
+        TableVectorizer(), cols=["s"], internal_backend="polars"
+    ).fit_transform(df)
+    assert isinstance(out, pd.DataFrame)
+    assert list(out.columns) == ["x", "s_a", "s_b", "s_None"]
+
+
+def test_bad_internal_backend(pd_module):
+    transformer = ApplyToSubFrame(Dummy(), internal_backend="spark")
+    with pytest.raises(ValueError, match=".*'internal_backend' should be"):
+        transformer.fit_transform(pd_module.example_dataframe)
+
+
+def test_transform_not_fitted(df_module):
+    with pytest.raises(NotFittedError, match=".*is not fitted yet"):
+        ApplyToSubFrame(Dummy()).transform(df_module.example_dataframe)
+
+
+def test_n_jobs(df_module):
+    df = df_module.make_dataframe({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+    transformer = ApplyToSubFrame(TableVectorizer(), n_jobs=2).fit(df)
+    assert transformer.transformer_.n_jobs == 2
+    assert transformer.transformer.n_jobs is None
+    # transformers without an n_jobs parameter are left unchanged
+    ApplyToSubFrame(FunctionTransformer(), n_jobs=2).fit(df)
+
+
+def test_aliased_fitted_attributes(df_module):
+    transformer = ApplyToSubFrame(Dummy(), cols=["a"])
+    assert not hasattr(transformer, "used_inputs_")
+    assert not hasattr(transformer, "feature_names_in_")
+    df = df_module.make_dataframe({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+    transformer.fit(df, [0.0, 1.0])
+    assert transformer.used_inputs_ == ["a"]
+    assert transformer.feature_names_in_ == ["a", "b"]
+    assert "used_inputs_" not in vars(transformer)
+
+
+def test_pickle(df_module):
+    df = df_module.make_dataframe({"a": [1.0, 2.0], "b": [3.0, 4.0], "c": [5.0, 6.0]})
+    transformer = ApplyToSubFrame(Dummy(), cols=["a", "c"]).fit(df, [0.0, 1.0])
+    state = transformer.__getstate__()
+    assert "_columns_set" not in state
+    assert "_feature_names_out" not in state
+    assert hasattr(transformer, "_columns_set")
+    loaded = pickle.loads(pickle.dumps(transformer))
+    df_module.assert_frame_equal(loaded.transform(df), transformer.transform(df))
+    assert (
+        loaded.get_feature_names_out().tolist()
+        == transformer.get_feature_names_out().tolist()
+    )
+    assert not loaded.get_feature_names_out().flags.writeable
+    reordered = s.select(df, ["c", "b", "a"])
+    assert sbd.column_names(loaded.transform(reordered)) == loaded.all_outputs_
@@ -197,3 +197,10 @@ def test_error_do_left_join():
         _join_utils._do_left_join(
             np.array([1]), right=None, left_on=None, right_on=None
         )
+
+
+def test_pick_column_names_many_duplicates():
+    names = _join_utils.pick_column_names(["a"] * 100, forbidden_names=["a", "b"])
+    assert len(set(names)) == 100
+    assert "a" not in names and "b" not in names
+    assert all(re.fullmatch(r"a__skrub_[0-9a-f]{8}__", n) for n in names)
@@ -5,6 +5,7 @@ from skrub import selectors as s
 from skrub._apply_to_each_col import ApplyToEachCol
 from skrub._apply_to_sub_frame import ApplyToSubFrame
 from skrub._datetime_encoder import DatetimeEncoder
+from skrub._table_vectorizer import TableVectorizer
 from skrub._to_datetime import ToDatetime
 from skrub._wrap_transformer import wrap_transformer
 
@@ -20,3 +21,16 @@ def test_wrap_transformer():
     assert isinstance(t, ApplyToEachCol)
     t = wrap_transformer(make_pipeline(StandardScaler()), s.all())
     assert isinstance(t, ApplyToSubFrame)
+
+
+def test_wrap_transformer_forwards_n_jobs(df_module):
+    X = df_module.make_dataframe({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+    t = wrap_transformer(TableVectorizer(n_jobs=1), s.all(), n_jobs=2).fit(X)
+    assert isinstance(t, ApplyToSubFrame)
+    assert t.transformer_.n_jobs == 2
+    # the default leaves the transformer's own n_jobs unchanged
+    t = wrap_transformer(TableVectorizer(n_jobs=1), s.all()).fit(X)
+    assert t.transformer_.n_jobs == 1
+    t = wrap_transformer(ToDatetime(), s.all(), n_jobs=2)
+    assert isinstance(t, ApplyToEachCol)
+    assert t.n_jobs == 2